@@ -1,11 +1,6 @@
 import argparse
-from .maps.plot_house import render_map_house
-from .maps.plot_senate import render_map_senate
-from .senate import SenateSource
-from .house import HouseSource
-from .geo.load_geo import load_states, load_districts
-from .geo.join_geo import join_votes
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 def main():
     p = argparse.ArgumentParser()
@@ -14,32 +9,56 @@ def main():
     p.add_argument("--session", type=int, required=True)
     p.add_argument("--roll", type=int, required=True)
     p.add_argument("--background", choices=["white", "transparent"], default="white", help="Background color")
+    p.add_argument("--out", type=Path, default=None, help="Output PNG path (default: out/vote_<chamber>_<congress>_<session>_<roll>.png)")
     args = p.parse_args()
 
-    print(f"Fetching Vote Data for {args.chamber}, {args.session}, {args.roll}...")
-
-    if args.chamber == "senate":
-        votes = SenateSource().fetch(args.congress, args.session, args.roll)
-    else:
-        votes = HouseSource().fetch(args.congress, args.roll)
+    # Heavy imports (matplotlib, pandas, geopandas) wait until the arguments
+    # parse, so --help and bad input return without paying for them.
+    # Agg is forced before pyplot loads so no GUI toolkit is ever imported.
+    import matplotlib
+    matplotlib.use("Agg")
+    from .maps.plot_house import render_map_house
+    from .maps.plot_senate import render_map_senate
+    from .senate import SenateSource
+    from .house import HouseSource
+    from .geo.load_geo import load_state_codes, load_districts
+    from .geo.join_geo import join_votes
+    from .config import savefig_kw
+    import matplotlib.pyplot as plt
 
+    print(f"Fetching Vote Data for {args.chamber}, {args.session}, {args.roll}...")
     print("Loading Geometry...")
-    shapes = load_states() if args.chamber == "senate" else load_districts()
+
+    # The vote download is network-bound and the shapefile read is disk-bound,
+    # so run them side by side instead of back to back.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        if args.chamber == "senate":
+            f_votes = ex.submit(SenateSource().fetch, args.congress, args.session, args.roll)
+            # The Senate tile map never draws state outlines, so skip the shapefile there
+            f_shapes = ex.submit(load_state_codes)
+        else:
+            f_votes = ex.submit(HouseSource().fetch, args.congress, args.roll)
+            f_shapes = ex.submit(load_districts)
+        votes, shapes = f_votes.result(), f_shapes.result()
 
     print("Joining Data...")
     merged = join_votes(args.chamber, votes, shapes)
 
     if args.chamber == "senate":
         print("Rendering Visualization...")
-        fig = render_map_senate(merged, title=f"{args.chamber.title()} {args.congress}-{args.session}-{args.roll}", background=args.background)
+        fig, ax = render_map_senate(merged, title=f"{args.chamber.title()} {args.congress}-{args.session}-{args.roll}", background=args.background)
     else:
         print("Rendering Visualization...")
-        fig = render_map_house(merged, title=f"{args.chamber.title()} {args.congress}-{args.session}-{args.roll}", background=args.background)
+        fig, ax = render_map_house(merged, title=f"{args.chamber.title()} {args.congress}-{args.session}-{args.roll}", background=args.background)
 
-    outfile = f"out/vote_{args.chamber}_{args.congress}_{args.session}_{args.roll}.png"
-    plt.savefig(outfile, dpi=200, bbox_inches="tight")
+    # Straight to PNG through Agg; no GUI backend or plt.show event loop involved
+    outfile = args.out or Path(f"out/vote_{args.chamber}_{args.congress}_{args.session}_{args.roll}.png")
+    outfile.parent.mkdir(parents=True, exist_ok=True)
+    # Renderers fit their axes to the data already, so skip bbox_inches="tight"
+    # and the extra render pass it costs. The CLI keeps its lighter 200 dpi.
+    fig.savefig(outfile, **{**savefig_kw(outfile), "dpi": 200})
     print(f"Saved {outfile}")
-    plt.close("all")
+    plt.close(fig)
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,6 @@
 # config.py
+import os
+from pathlib import Path
 
 # Just a dumb color dict – keep it simple
 COLORS = {
@@ -22,4 +24,18 @@ def color_for(key: str) -> str:
 
 def style_for(key: str) -> str:
     """Get a style value by a simple name like 'default', 'bold', 'faint'."""
-    return STYLES[key]
\ No newline at end of file
+    return STYLES[key]
+
+def cache_dir() -> Path:
+    """Directory for cached downloads. Override with the VOTEVIS_CACHE_DIR env var."""
+    return Path(os.environ.get("VOTEVIS_CACHE_DIR") or Path.home() / ".cache" / "vote-visualizer")
+
+# PNG export settings shared by every renderer. zlib level 3 encodes several
+# times faster than matplotlib's default 6 and barely grows flat-colour maps.
+SAVEFIG_KW = {"dpi": 220, "pil_kwargs": {"compress_level": 3}}
+
+def savefig_kw(outfile) -> dict:
+    """savefig kwargs for `outfile`; pil_kwargs only applies to Pillow formats like PNG."""
+    if str(outfile).lower().endswith(".png"):
+        return SAVEFIG_KW
+    return {k: v for k, v in SAVEFIG_KW.items() if k != "pil_kwargs"}
@@ -1,6 +1,3 @@
-import pandas as pd
-
-
 def join_votes(chamber, votes, shapes):
     # Detect if house or senate via the chamber argument
     if chamber == "senate":
@@ -15,14 +12,19 @@ def join_votes(chamber, votes, shapes):
 
 # Helper function to join votes with shapes for senate (states)
 def join_votes_state(votes, shapes):
-    joined = pd.merge(
-        left=shapes, right=votes, left_on="STUSPS", right_on="geoid", how="left"
-    )
+    # Align on the postal code index rather than hashing both key columns in a merge.
+    # The loaders already index by STUSPS; anything else gets indexed here.
+    if shapes.index.name != "STUSPS":
+        shapes = shapes.set_index("STUSPS", drop=False)
+    joined = shapes.join(votes.set_index("geoid"), how="left").rename_axis(None)
     return joined
 
 
 # Helper function to join votes with shapes for house (districts)
 def join_votes_district(votes, shapes):
-    df_agg = votes.groupby("geoid", as_index=False)["vote"].first()
-    merged = shapes.merge(df_agg, how="left", left_on="GEOID", right_on="geoid")
+    # First occurrence per district wins; a linear dedupe, no groupby machinery
+    df_agg = votes.drop_duplicates(subset="geoid", keep="first")[["geoid", "vote"]]
+    if shapes.index.name != "GEOID":
+        shapes = shapes.set_index("GEOID", drop=False)
+    merged = shapes.join(df_agg.set_index("geoid"), how="left").rename_axis(None)
     return merged
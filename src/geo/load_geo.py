@@ -1,5 +1,10 @@
+import importlib.util
 import os
+from functools import lru_cache
 import geopandas as gpd
+import pandas as pd
+import shapely
+import us
 
 STATE_MAP_FILE_PATH = "data/states/cb_2018_us_state_20m.shp"
 DISTRICT_MAP_FILE_PATH = "data/districts/cb_2018_us_cd116_20m.shp"
@@ -7,6 +12,96 @@ DISTRICT_MAP_FILE_PATH = "data/districts/cb_2018_us_cd116_20m.shp"
 state_map = STATE_MAP_FILE_PATH  # Path to the shapefile of
 district_map = DISTRICT_MAP_FILE_PATH# Path to the shapefile of US congressional districts
 
+# Douglas-Peucker tolerance / grid size in degrees (shapefiles are EPSG:4269).
+# At the size the map is drawn, detail below this is invisible.
+STATE_SIMPLIFY_TOLERANCE = 0.05
+DISTRICT_SIMPLIFY_TOLERANCE = 0.01  # districts are smaller, keep more detail
+COORD_PRECISION = 1e-5
+
+# Plotting CRS (CONUS Albers equal-area). Projected once at cache-build time,
+# after simplifying, so no render ever pays a per-vertex pyproj transform.
+PLOT_CRS = "EPSG:5070"
+
+
+def _simplify(gdf, tolerance):
+    # Fewer vertices -> fewer path segments for matplotlib to push through Agg
+    geoms = gdf.geometry.simplify(tolerance, preserve_topology=True)
+    geoms = shapely.set_precision(geoms.values, COORD_PRECISION)
+    return gdf.set_geometry(gpd.GeoSeries(geoms, index=gdf.index, crs=gdf.crs))
+
+
+# Bump when the cached frame changes in a way the file name doesn't capture
+# (column subset, row filter, ...). Tolerance, precision and CRS are in the name.
+CACHE_VERSION = 1
+
+
+def _cache_path(shape_file, tolerance):
+    # Filtered copy of the shapefile, stored next to it. The name carries every
+    # setting the contents depend on, so changing one never serves a stale copy.
+    crs = PLOT_CRS.replace(":", "")
+    return f"{shape_file}.filtered.{crs}.{tolerance}.{COORD_PRECISION}.v{CACHE_VERSION}.feather"
+
+
+def _read_cached(shape_file, mtime, build, tolerance):
+    """
+    Return the filtered frame for `shape_file`, building it with `build` on a miss.
+
+    The result is written to a feather file beside the shapefile so later
+    processes skip the DBF/SHP parse entirely.
+    """
+    if importlib.util.find_spec("pyarrow") is None:
+        return build(shape_file)  # feather needs pyarrow; without it, no disk cache
+
+    cache = _cache_path(shape_file, tolerance)
+    if os.path.exists(cache) and os.path.getmtime(cache) >= mtime:
+        return gpd.read_feather(cache)
+
+    gdf = build(shape_file)
+    try:
+        gdf.to_feather(cache)
+    except OSError:
+        pass  # read-only data dir, just skip the on-disk cache
+    return gdf
+
+
+def _read_states(shape_file):
+    # Drop hawaii and alaska - they make the map look shit and PR because it has no vote.
+    # The filter and column subset are pushed down to OGR, so skipped rows and
+    # unused DBF columns never reach Python.
+    gdf = gpd.read_file(
+        shape_file,
+        engine="pyogrio",
+        columns=["STUSPS", "NAME"],
+        where="NAME NOT IN ('District of Columbia', 'Puerto Rico')",
+    )
+    # print(gdf)
+    return _simplify(gdf, STATE_SIMPLIFY_TOLERANCE).to_crs(PLOT_CRS)
+
+
+def _read_districts(shape_file):
+    # Drop non-contiguous areas if present (e.g. PR, AK, HI, GU, VI, etc),
+    # filtered by OGR while reading, along with the unused DBF columns
+    gdf = gpd.read_file(
+        shape_file,
+        engine="pyogrio",
+        columns=["GEOID", "STATEFP"],
+        where="STATEFP NOT IN ('02', '15', '60', '66', '69', '72', '78')",
+    )
+    return _simplify(gdf, DISTRICT_SIMPLIFY_TOLERANCE).to_crs(PLOT_CRS)
+
+
+# One cached frame per (path, mtime): repeat loads in a process skip the read.
+# Frames come back indexed by their join key so join_votes can align on it
+# directly instead of rebuilding a hash table every run.
+@lru_cache(maxsize=1)
+def _load_states(shape_file, mtime):
+    return _read_cached(shape_file, mtime, _read_states, STATE_SIMPLIFY_TOLERANCE).set_index("STUSPS", drop=False)
+
+
+@lru_cache(maxsize=1)
+def _load_districts(shape_file, mtime):
+    return _read_cached(shape_file, mtime, _read_districts, DISTRICT_SIMPLIFY_TOLERANCE).set_index("GEOID", drop=False)
+
 
 def load_states():
     """
@@ -15,30 +110,46 @@ def load_states():
     Returns
     -------
     gpd.GeoDataFrame
-        A GeoDataFrame containing the geometry of US states.
+        A GeoDataFrame containing the geometry of US states, indexed by STUSPS.
     """
     if not state_map:
         raise RuntimeError("STATE_MAP_FILE_PATH is not set. Check your .env.")
-    gdf = gpd.read_file(state_map)
-    # print(gdf)
+    gdf = _load_states(state_map, os.stat(state_map).st_mtime)
 
-    # Drop hawaii and alaska - they make the map look shit and PR because it has no vote.
-    gdf = gdf[~gdf["NAME"].isin(["District of Columbia", "Puerto Rico"])]
+    # Hand out a copy so callers can't mutate the cached frame
+    return gdf.copy()
 
-    return gdf
+
+def load_state_codes():
+    """
+    State rows for the Senate tile map, built without touching the shapefile.
+
+    The tile renderer places states on a fixed grid and never reads geometry,
+    so the 50 postal codes are all it needs.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        STUSPS and NAME for every state, indexed by STUSPS, with an
+        all-empty geometry column.
+    """
+    codes = pd.Index([s.abbr for s in us.STATES], name="STUSPS")
+    return gpd.GeoDataFrame(
+        {"STUSPS": codes, "NAME": [s.name for s in us.STATES]},
+        geometry=gpd.GeoSeries([None] * len(codes), index=codes),
+        index=codes,
+    )
 
 
 def load_districts():
     """
     Load the congressional district shapefile (GeoDataFrame).
 
-    Uses the DISTRICT_MAP_FILE_PATH provided in .env.
+    Uses the DISTRICT_MAP_FILE_PATH provided in .env. Rows are indexed by GEOID.
     """
     if not district_map:
         raise RuntimeError("DISTRICT_MAP_FILE_PATH is not set. Check your .env.")
-    gdf = gpd.read_file(district_map)
+    gdf = _load_districts(district_map, os.stat(district_map).st_mtime)
 
-    # Drop non-contiguous areas if present (e.g. PR, AK, HI, GU, VI, etc)
-    gdf = gdf[~gdf["STATEFP"].isin(["02", "15", "60", "66", "69", "72", "78"])]
-
-    return gdf
+    # Hand out a copy so callers can't mutate the cached frame
+    return gdf.copy()
@@ -1,6 +1,14 @@
-import requests
+import gzip
+import io
+import json
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 import xml.etree.ElementTree as ET
 import pandas as pd
+from .config import cache_dir
+from .net import SESSION
+from .xml_stream import iter_elements
 
 STATEFP = {
     "AL":"01","AK":"02","AZ":"04","AR":"05","CA":"06","CO":"08","CT":"09","DE":"10","DC":"11",
@@ -12,6 +20,9 @@ STATEFP = {
     "MP":"69","AS":"60"
 }
 
+# Series form of STATEFP so vectorised .map is a straight index lookup
+STATEFP_SER = pd.Series(STATEFP, name="fips")
+
 MEMBER_URL = "https://clerk.house.gov/xml/lists/memberdata.xml"
 
 
@@ -19,37 +30,67 @@ def _congress_to_year(congress: int) -> int:
     return 1789 + (congress - 1) * 2
 
 
-def _house_url(year: int, roll: int) -> str:
-    # if you already know the exact url, you can skip the HEADs and return it directly
-    for path in (
-        f"https://clerk.house.gov/evs/{year}/roll{roll:03d}.xml",
-        f"https://clerk.house.gov/evs/{year}/roll{roll:04d}.xml",
-    ):
-        try:
-            if requests.head(path, timeout=10).status_code == 200:
-                return path
-        except requests.RequestException:
-            pass
+def _house_url(year: int, roll: int, width: int = 3) -> str:
+    return f"https://clerk.house.gov/evs/{year}/roll{roll:0{width}d}.xml"
+
+
+def _roll_cache_file(year: int, roll: int):
+    # Same as the Senate: a recorded roll call never changes once published
+    return cache_dir() / "house" / f"{year}_{roll:05d}.xml.gz"
+
+
+def _download_house_roll(year: int, roll: int) -> bytes:
+    # GET straight away instead of HEAD-probing first; only a 404 falls
+    # through to the 4-digit filename
+    for width in (3, 4):
+        r = SESSION.get(_house_url(year, roll, width), timeout=20)
+        if r.status_code == 404:
+            continue
+        r.raise_for_status()
+        return r.content
     raise ValueError(f"No valid URL found for {year}-{roll}")
 
 
-def _parse_house_roll(root) -> pd.DataFrame:
-    rows = []
-    for rv in root.findall(".//recorded-vote"):
+def _get_house_roll(year: int, roll: int) -> bytes:
+    cached = _roll_cache_file(year, roll)
+    if cached.exists():
+        with gzip.open(cached, "rb") as f:
+            return f.read()
+
+    content = _download_house_roll(year, roll)
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_name(cached.name + ".part")
+    try:
+        with gzip.open(tmp, "wb", compresslevel=6) as out:
+            out.write(content)
+        tmp.replace(cached)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return content
+
+
+def _parse_house_roll(source) -> pd.DataFrame:
+    # Stream <recorded-vote> records into parallel columns, DataFrame built once
+    bioguides, states, districts, votes = [], [], [], []
+    for rv in iter_elements(source, "recorded-vote"):
         leg = rv.find("legislator")
         if leg is None:
             continue
-        bioguide = (leg.get("name-id") or "").strip()
-        state = (leg.get("state") or "").strip()
-        vote = (rv.findtext("vote") or "").strip()
-        rows.append({"bioguide": bioguide, "state": state, "vote": vote})
-    return pd.DataFrame(rows)
+        bioguides.append((leg.get("name-id") or "").strip())
+        states.append((leg.get("state") or "").strip())
+        districts.append((leg.get("district") or "").strip())
+        votes.append((rv.findtext("vote") or "").strip())
+    return pd.DataFrame(
+        {"bioguide": bioguides, "state": states, "district": districts, "vote": votes}
+    )
 
 
-def _load_member_map_from_web() -> dict:
-    r = requests.get(MEMBER_URL, timeout=20)
-    r.raise_for_status()
-    root = ET.fromstring(r.content)
+def _roster_cache_file():
+    return cache_dir() / "house" / "memberdata.json"
+
+
+def _parse_member_map(content: bytes) -> dict:
+    root = ET.fromstring(content)
     mapping = {}
     for m in root.findall(".//member"):
         bid = (m.findtext(".//bioguideID") or "").strip()
@@ -61,30 +102,92 @@ def _load_member_map_from_web() -> dict:
     return mapping
 
 
+@lru_cache(maxsize=1)
+def _load_member_map_from_web() -> dict:
+    # The roster rarely changes mid-Congress: keep the parsed map on disk and
+    # revalidate it with a conditional GET, so a warm cache costs one 304.
+    cache = _roster_cache_file()
+    try:
+        cached = json.loads(cache.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        cached = None  # missing or truncated: refetch in full
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    r = SESSION.get(MEMBER_URL, timeout=20, headers=headers)
+    if r.status_code == 304 and cached:
+        return cached["map"]
+    r.raise_for_status()
+
+    mapping = _parse_member_map(r.content)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache.with_name(cache.name + ".part")
+    try:
+        tmp.write_text(json.dumps({
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "map": mapping,
+        }))
+        tmp.replace(cache)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return mapping
+
+
+def _geoid_frame(state_abbr: pd.Series, dist: pd.Series, vote: pd.Series) -> pd.DataFrame:
+    # Vectorised: state FIPS + 2-digit district, no per-row loop
+    statefp = state_abbr.map(STATEFP_SER)
+    keep = statefp.notna() & (dist != "")
+    geoid = statefp[keep] + dist[keep].str.zfill(2)
+    # A handful of distinct labels: categorical codes keep colouring an int gather
+    vote = vote[keep].astype("category")
+    return pd.DataFrame({"geoid": geoid, "vote": vote}).reset_index(drop=True)
+
+
 def _build_geoid_df(votes_df: pd.DataFrame, bioguide_to_sd: dict) -> pd.DataFrame:
-    out = []
-    for _, r in votes_df.iterrows():
-        sd = bioguide_to_sd.get(r["bioguide"], "")
-        if not sd:
-            continue
-        state_abbr, dist = sd[:2], sd[2:].zfill(2) if sd[2:] else ""
-        statefp = STATEFP.get(state_abbr, "")
-        if statefp and dist:
-            geoid = f"{statefp}{dist}"
-            out.append({"geoid": geoid, "vote": r["vote"]})
-    return pd.DataFrame(out)
+    # 'NY10'-style roster codes split into state + district
+    sd = votes_df["bioguide"].map(bioguide_to_sd).fillna("").astype(str)
+    return _geoid_frame(sd.str[:2], sd.str[2:], votes_df["vote"])
+
+
+def _build_geoid_df_from_districts(votes_df: pd.DataFrame) -> pd.DataFrame:
+    # The roll call already says where each member sits; at-large seats are '00'
+    dist = votes_df["district"]
+    dist = dist.where(dist.str.isdigit() | (dist == ""), "00")
+    return _geoid_frame(votes_df["state"], dist, votes_df["vote"])
+
+
+def _in_background(fn) -> Future:
+    """Run `fn` on a daemon thread. The Future may be dropped unread without holding up exit."""
+    fut = Future()
+
+    def run():
+        if fut.set_running_or_notify_cancel():
+            try:
+                fut.set_result(fn())
+            except BaseException as e:
+                fut.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return fut
 
 
 class HouseSource:
     def fetch(self, congress: int, roll: int) -> pd.DataFrame:
         year = _congress_to_year(congress)
-        url = _house_url(year, roll)
-        r = requests.get(url, timeout=20)
-        r.raise_for_status()
-
-        votes_df = _parse_house_roll(ET.fromstring(r.content))
-        member_map = _load_member_map_from_web()  # <-- the real roster, not r.content
-        result = _build_geoid_df(votes_df, member_map)
+        # Start the roster load alongside the roll-call download so the two
+        # network round trips overlap; it is only waited on if it's needed.
+        fut_roster = _in_background(_load_member_map_from_web)
+        votes_df = _parse_house_roll(io.BytesIO(_get_house_roll(year, roll)))
+        if len(votes_df) and (votes_df["district"] != "").all():
+            # District is on every record: the roster is left unread
+            result = _build_geoid_df_from_districts(votes_df)
+        else:
+            result = _build_geoid_df(votes_df, fut_roster.result())
 
         # quick sanity logs
         print(
@@ -3,7 +3,12 @@ import matplotlib
 matplotlib.use("Agg")  # headless
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from ..config import color_for, style_for
+import numpy as np
+import pandas as pd
+import shapely
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+from ..config import color_for, savefig_kw, style_for
 
 # Consistent colors for categories
 VOTE_PALETTE = {
@@ -13,6 +18,52 @@ VOTE_PALETTE = {
     "Not Voting": color_for("not_voting"),
 }
 
+# Legend handles depend only on the palette, so build them once
+_LEGEND_HANDLES = {v: mpatches.Patch(color=c, label=v) for v, c in VOTE_PALETTE.items()}
+
+# Palette indexed by categorical vote code. The trailing slot is the fallback
+# colour, which code -1 (unknown label or no vote) picks up for free.
+VOTE_ORDER = tuple(VOTE_PALETTE)
+_VOTE_INDEX = pd.Index(VOTE_ORDER)
+_PALETTE = np.array([*VOTE_PALETTE.values(), color_for("not_voting")])
+
+
+def _polygon_paths(geoms):
+    """One compound Path per polygon part (exterior plus holes), plus the row index each came from."""
+    # Vectorised shapely 2 calls: explode MultiPolygons, split each part into
+    # its rings and pull every coordinate in one array, then cut it back into
+    # one path per part.
+    parts, owner = shapely.get_parts(np.asarray(geoms), return_index=True)
+    keep = ~shapely.is_empty(parts)
+    parts, owner = parts[keep], owner[keep]
+    if len(parts) == 0:
+        return [], owner
+    rings, ring_part = shapely.get_rings(parts, return_index=True)
+    # Agg fills with the nonzero rule, so a hole only cuts out if it winds
+    # against its exterior: force exteriors CCW and holes CW.
+    is_exterior = np.r_[True, ring_part[1:] != ring_part[:-1]]
+    rings = np.where(shapely.is_ccw(rings) == is_exterior, rings, shapely.reverse(rings))
+
+    coords = shapely.get_coordinates(rings)
+    counts = shapely.get_num_coordinates(rings)
+    ends = np.cumsum(counts)
+    codes = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+    codes[ends - counts] = Path.MOVETO
+    codes[ends - 1] = Path.CLOSEPOLY
+
+    cuts = np.cumsum(np.bincount(ring_part, weights=counts, minlength=len(parts)).astype(int))[:-1]
+    paths = [Path(v, c) for v, c in zip(np.split(coords, cuts), np.split(codes, cuts))]
+    return paths, owner
+
+
+def _set_map_aspect(ax, gdf):
+    # Same aspect GeoDataFrame.plot would pick: stretch lat/lon by latitude
+    if gdf.crs is not None and gdf.crs.is_geographic:
+        miny, maxy = gdf.total_bounds[[1, 3]]
+        ax.set_aspect(1 / np.cos(np.radians((miny + maxy) / 2)))
+    else:
+        ax.set_aspect("equal")
+
 
 def render_map_house(gdf, background, title="Map", vote_col="vote", outfile=None, show=False):
     # Lazy import to avoid hard dep at import time
@@ -25,21 +76,36 @@ def render_map_house(gdf, background, title="Map", vote_col="vote", outfile=None
     if vote_col not in gdf.columns:
         raise ValueError(f"GeoDataFrame must contain '{vote_col}' for coloring")
 
-    # Map votes -> colors. Unknowns to light gray.
-    colors = gdf[vote_col].map(VOTE_PALETTE).fillna(color_for("not_voting"))
+    # Map votes -> colors with one integer gather. Unknowns to light gray.
+    # get_indexer gives -1 for labels outside the palette (Clerk's Yea/Nay)
+    codes = _VOTE_INDEX.get_indexer(gdf[vote_col].astype(object))
+    colors = _PALETTE[codes]
 
     fig, ax = plt.subplots(figsize=(10, 6))
-    gdf.plot(ax=ax, color=colors, edgecolor=color_for("lines"), linewidth=style_for("default"))
-    
+
+    # One PathCollection for every district: a single artist and draw call
+    # instead of one patch per geometry. Holes stay holes, so enclaves inside
+    # a district keep their own colour.
+    paths, owner = _polygon_paths(gdf.geometry)
+    coll = PathCollection(
+        paths,
+        facecolors=colors[owner],
+        edgecolors=color_for("lines"),
+        linewidths=style_for("default"),
+    )
+    ax.add_collection(coll)
+    if len(paths):
+        minx, miny, maxx, maxy = gdf.total_bounds
+        ax.set_xlim(minx, maxx)
+        ax.set_ylim(miny, maxy)
+    _set_map_aspect(ax, gdf)
+
     ax.set_axis_off()
 
     # Legend for categorical votes
-    present_values = [
-        v
-        for v in ["Aye", "No", "Present", "Not Voting"]
-        if v in set(gdf[vote_col].dropna().unique())
-    ]
-    handles = [mpatches.Patch(color=VOTE_PALETTE[v], label=v) for v in present_values]
+    used_codes = set(codes.tolist())
+    present_values = [v for code, v in enumerate(VOTE_ORDER) if code in used_codes]
+    handles = [_LEGEND_HANDLES[v] for v in present_values]
     if handles and background == "white":
         ax.legend(handles=handles, title="Vote", loc="lower left", frameon=True)
         ax.set_title(title)
@@ -49,7 +115,9 @@ def render_map_house(gdf, background, title="Map", vote_col="vote", outfile=None
     fig.tight_layout()
 
     if outfile:
-        fig.savefig(outfile, dpi=220, bbox_inches="tight")
+        # Figure is laid out by tight_layout above; bbox_inches="tight" would
+        # render everything twice just to measure it
+        fig.savefig(outfile, **savefig_kw(outfile))
         print(f"Saved {outfile} (backend {matplotlib.get_backend()})")
     if show:
         # Only works if you switch to an interactive backend
@@ -3,9 +3,11 @@ import matplotlib
 matplotlib.use("Agg")  # headless
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import PolyCollection
+import numpy as np
 import pandas as pd
 import geopandas as gpd
-from ..config import color_for
+from ..config import color_for, savefig_kw
 
 # Normalize vote labels coming from the Senate XML
 VOTE_NORMALIZE = {
@@ -16,11 +18,11 @@ VOTE_NORMALIZE = {
     "Excused": "Not Voting", "Absent": "Not Voting", None: "Not Voting",
 }
 
-def _normalize_vote(v):
-    if v is None:
-        return "Not Voting"
-    v = str(v).strip()
-    return VOTE_NORMALIZE.get(v, v)
+def _normalize_votes(votes: pd.Series) -> pd.Series:
+    """Normalize a column of vote labels in one pass; missing votes become 'Not Voting'."""
+    s = votes.astype(object).fillna("Not Voting").astype(str).str.strip()
+    # Unlisted labels pass through unchanged
+    return s.map(VOTE_NORMALIZE).fillna(s)
 
 # Keep colors consistent with the project palette (same as House)
 # Green, Red, Orange, Gray
@@ -31,6 +33,21 @@ VOTE_PALETTE = {
     "Not Voting": color_for("not_voting"),
 }
 
+# Integer-coded votes: a code indexes straight into the palette array, so
+# colouring every tile is one NumPy gather instead of per-tile dict lookups.
+VOTE_ORDER = ("Yea", "Nay", "Present", "Not Voting")
+_NOT_VOTING_CODE = VOTE_ORDER.index("Not Voting")
+_PALETTE = np.array([VOTE_PALETTE[v] for v in VOTE_ORDER])
+
+# Legend handles depend only on the palette, so build them once (indexed by code)
+_LEGEND_HANDLES = tuple(mpatches.Patch(color=VOTE_PALETTE[v], label=v) for v in VOTE_ORDER)
+
+_VOTE_INDEX = pd.Index(VOTE_ORDER)
+
+def _vote_codes(labels) -> np.ndarray:
+    """Map normalized vote labels to int8 codes; unknown labels become -1."""
+    return _VOTE_INDEX.get_indexer(np.asarray(labels, dtype=object)).astype(np.int8)
+
 # A standard 50–state tile layout (similar to FiveThirtyEight/R-tilemap style).
 # row 0 is top. (row, col) positions form a contiguous USA-ish block plus AK, HI.
 TILE_POS = {
@@ -47,10 +64,10 @@ TILE_POS = {
 
 # If a state isn’t in TILE_POS, we’ll place it in a simple spillover row to avoid crashes.
 
-def _votes_by_state(joined: gpd.GeoDataFrame, vote_col: str) -> dict:
+def _votes_by_state(joined: gpd.GeoDataFrame, vote_col: str) -> pd.DataFrame:
     """
     Input: GeoDataFrame after join (two rows per state for Senate).
-    Output: { 'STUSPS' -> [vote_for_sen1, vote_for_sen2] }
+    Output: DataFrame indexed by STUSPS with columns 0, 1 (vote for sen1, sen2).
     Ordering is deterministic but not seniority: preserve XML order as merged.
     If fewer than two rows are present, pad with 'Not Voting'.
     """
@@ -60,15 +77,20 @@ def _votes_by_state(joined: gpd.GeoDataFrame, vote_col: str) -> dict:
     # Keep insertion order from the source (stable groupby with cumcount later)
     joined = joined[["STUSPS", vote_col]].copy()
     # Normalize vote labels
-    joined[vote_col] = joined[vote_col].map(_normalize_vote)
-
-    votes = {}
-    for st, grp in joined.groupby("STUSPS", sort=False):
-        vals = [v for v in grp[vote_col].tolist() if pd.notna(v)]
-        # pad/truncate to exactly two entries
-        vals = (vals + ["Not Voting", "Not Voting"])[:2]
-        votes[st] = vals
-    return votes
+    joined[vote_col] = _normalize_votes(joined[vote_col])
+    states = pd.unique(joined["STUSPS"])
+
+    # Seat slot per state (0, 1, ...) in source order, then one pivot to two
+    # columns; anything past two is truncated, missing seats padded.
+    joined["_slot"] = joined.groupby("STUSPS", sort=False).cumcount()
+    wide = (
+        joined[joined["_slot"] < 2]
+        .pivot(index="STUSPS", columns="_slot", values=vote_col)
+        .reindex(index=states, columns=[0, 1])
+        .fillna("Not Voting")
+        .rename_axis(columns=None)
+    )
+    return wide
 
 def _tile_bbox(tile_size=1.0, gap=0.08):
     w = tile_size
@@ -76,6 +98,44 @@ def _tile_bbox(tile_size=1.0, gap=0.08):
     inner_gap = gap
     return w, h, inner_gap
 
+def _rect(x, y, w, h):
+    return np.array([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+
+def _tile_verts(r, c):
+    """Corner arrays for the (outer, left, right) rectangles of the tile at row r, col c."""
+    tile_w, tile_h, inner_gap = _tile_bbox()
+    x0 = c * (tile_w + 0.1)
+    y0 = -r * (tile_h + 0.1)
+
+    # Two inner rectangles: left & right
+    inner_w = (tile_w - inner_gap) / 2.0
+    inner_h = tile_h - inner_gap
+    inner_y = y0 + inner_gap / 2.0
+    left_x  = x0 + inner_gap / 2.0
+    right_x = x0 + inner_gap / 2.0 + inner_w + inner_gap / 2.0
+    return (
+        _rect(x0, y0, tile_w, tile_h),
+        _rect(left_x, inner_y, inner_w, inner_h),
+        _rect(right_x, inner_y, inner_w, inner_h),
+    )
+
+# The grid never moves, so tile geometry is worked out once here; a render
+# only picks colours and hands the cached corners to the collections.
+_TILE_VERTS = {st: _tile_verts(r, c) for st, (r, c) in TILE_POS.items()}
+
+# Draw order (row, then column), sorted once rather than on every render
+_TILE_ORDER = tuple(sorted(TILE_POS, key=lambda st: (*TILE_POS[st], st)))
+
+# Fixed data extent of the grid. The figure is sized in proportion to it so
+# the saved image already fits and savefig needs no tight-bbox pass.
+GRID_XLIM = (-0.5, 14.5)
+GRID_YLIM = (-9.5, 1.5)
+_INCHES_PER_TILE = 0.8
+_FIGSIZE = (
+    (GRID_XLIM[1] - GRID_XLIM[0]) * _INCHES_PER_TILE,
+    (GRID_YLIM[1] - GRID_YLIM[0]) * _INCHES_PER_TILE,
+)
+
 def render_map_senate(
     gdf: gpd.GeoDataFrame,
     background: str,
@@ -91,70 +151,61 @@ def render_map_senate(
     if not isinstance(gdf, gpd.GeoDataFrame):
         raise TypeError("render_map_senate expects a GeoDataFrame after join_votes(...).")
 
-    # Build state -> [vote1, vote2] map
+    # One row per state, one column per seat
     state_votes = _votes_by_state(gdf, vote_col)
 
-    fig, ax = plt.subplots(figsize=(12, 8))
+    # Encode both seats of every state at once; unknown labels draw as Not Voting
+    codes = _vote_codes(state_votes.to_numpy().ravel()).reshape(-1, 2)
+    tile_colors = dict(zip(state_votes.index, _PALETTE[np.where(codes < 0, _NOT_VOTING_CODE, codes)]))
+
+    fig, ax = plt.subplots(figsize=_FIGSIZE)
     ax.set_axis_off()
 
     # geometry not used for placement; we draw a grid
-    tile_w, tile_h, inner_gap = _tile_bbox()
-
-    # Track encountered states to drop exact duplicates
-    plotted = set()
+    tile_w, tile_h, _ = _tile_bbox()
 
     # Build a reverse lookup for spillover placement if a state isn’t in TILE_POS
     spill_row = 8
     spill_col = 2
 
-    # Draw tiles
-    for st in sorted(state_votes.keys(), key=lambda s: (TILE_POS.get(s, (99, 99))[0], TILE_POS.get(s, (99, 99))[1], s)):
-        if st in plotted:
-            continue
-        plotted.add(st)
-
-        r, c = TILE_POS.get(st, (spill_row, spill_col))
-        if st not in TILE_POS:
+    # Collect rectangles per layer; each layer becomes one PolyCollection.
+    # Both seat halves of every tile share a layer, coloured per rectangle.
+    outer_rects, seat_rects, seat_colors = [], [], []
+
+    # Draw tiles: grid states in the precomputed order, then any spillover
+    # states (one row per state already, so no duplicates to skip)
+    voted = set(state_votes.index)
+    order = [st for st in _TILE_ORDER if st in voted] + sorted(voted.difference(TILE_POS))
+    for st in order:
+        verts = _TILE_VERTS.get(st)
+        if verts is None:
+            verts = _tile_verts(spill_row, spill_col)
             spill_col += 1  # move along the spill row
+        outer, left, right = verts
+        x0, y0 = outer[0]
 
-        # Outer tile (background)
-        x0 = c * (tile_w + 0.1)
-        y0 = -r * (tile_h + 0.1)
-
-        # Two inner rectangles: left & right
-        votes = state_votes.get(st, ["Not Voting", "Not Voting"])
-        left_col  = VOTE_PALETTE.get(_normalize_vote(votes[0]), VOTE_PALETTE["Not Voting"])
-        right_col = VOTE_PALETTE.get(_normalize_vote(votes[1]), VOTE_PALETTE["Not Voting"])
-
-        # Outer border tile
-        outer = plt.Rectangle((x0, y0), tile_w, tile_h, linewidth=0.8, edgecolor=color_for("lines"), facecolor=color_for("lines"))
-        ax.add_patch(outer)
-
-        # Inner two blocks
-        inner_w = (tile_w - inner_gap) / 2.0
-        inner_h = tile_h - inner_gap
-        inner_y = y0 + inner_gap / 2.0
-        left_x  = x0 + inner_gap / 2.0
-        right_x = x0 + inner_gap / 2.0 + inner_w + inner_gap / 2.0
-
-        ax.add_patch(plt.Rectangle((left_x,  inner_y), inner_w, inner_h, facecolor=left_col,  edgecolor="none"))
-        ax.add_patch(plt.Rectangle((right_x, inner_y), inner_w, inner_h, facecolor=right_col, edgecolor="none"))
+        # Outer border tile and the two inner blocks
+        outer_rects.append(outer)
+        seat_rects.extend((left, right))
+        seat_colors.extend(tile_colors[st])
 
         # State label
         ax.text(x0 + tile_w / 2.0, y0 + tile_h / 2.0, st,
                 ha="center", va="center", fontsize=9, color="white", weight="bold")
-    
-    ax.set_xlim(-0.5, 14.5)
-    ax.set_ylim(-9.5, 1.5)
+
+    ax.add_collection(PolyCollection(outer_rects, linewidths=0.8, edgecolors=color_for("lines"), facecolors=color_for("lines")))
+    ax.add_collection(PolyCollection(seat_rects, facecolors=seat_colors, edgecolors="none"))
+
+    ax.set_xlim(*GRID_XLIM)
+    ax.set_ylim(*GRID_YLIM)
     ax.set_aspect("equal", adjustable="box")
 
     # Legend (only include categories used)
     if background == "white":
-        used_cats = pd.unique([_normalize_vote(v) for vs in state_votes.values() for v in vs])
-        handles = []
-        for cat in ["Yea", "Nay", "Present", "Not Voting"]:
-            if cat in used_cats:
-                handles.append(mpatches.Patch(color=VOTE_PALETTE[cat], label=cat))
+        # Codes are already normalized and sorted by VOTE_ORDER, so the used
+        # categories fall straight out of np.unique. Unknown labels (-1) are
+        # grey on the map but get no entry: they are not "Not Voting".
+        handles = [_LEGEND_HANDLES[code] for code in np.unique(codes) if code >= 0]
         if handles:
             ax.legend(handles=handles, title="Vote", loc="lower left", frameon=True)
 
@@ -167,7 +218,7 @@ def render_map_senate(
     fig.tight_layout()
 
     if outfile:
-        fig.savefig(outfile, dpi=220, bbox_inches="tight")
+        fig.savefig(outfile, **savefig_kw(outfile))
         print(f"Saved {outfile} (backend {matplotlib.get_backend()})")
     if show:
         plt.show()
@@ -0,0 +1,8 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+# One keep-alive session shared by every source (senate.gov, clerk.house.gov),
+# so each host's TCP/TLS handshake is paid once per process.
+SESSION = requests.Session()
+SESSION.headers.update({"Accept-Encoding": "gzip", "User-Agent": "vote-visualizer/1.0"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
@@ -1,6 +1,8 @@
-import requests
-import xml.etree.ElementTree as ET
+import gzip
 import pandas as pd
+from .config import cache_dir
+from .net import SESSION
+from .xml_stream import iter_elements
 
 
 def _senate_url(congress: int, session: int, roll: int) -> str:
@@ -10,24 +12,61 @@ def _senate_url(congress: int, session: int, roll: int) -> str:
     )
 
 
-def _parse_senate_members(root) -> pd.DataFrame:
-    rows = []
-    for m in root.findall("./members/member"):
+def _cache_file(congress: int, session: int, roll: int):
+    # Past roll calls never change, so a local copy never goes stale
+    return cache_dir() / "senate" / f"{congress:03d}_{session}_{roll:05d}.xml.gz"
+
+
+class _TeeReader:
+    """File-like wrapper that copies every chunk read from `src` into `sink`."""
+
+    def __init__(self, src, sink):
+        self._src = src
+        self._sink = sink
+
+    def read(self, size=-1):
+        chunk = self._src.read(size)
+        self._sink.write(chunk)
+        return chunk
+
+
+def _parse_senate_members(source) -> pd.DataFrame:
+    states, votes = [], []
+    for m in iter_elements(source, "member"):
         state = (m.findtext("state") or "").strip()
         vote = (m.findtext("vote_cast") or "").strip() or "Not Voting"
         if state:
-            rows.append({"geoid": state, "vote": vote})
-    return pd.DataFrame(rows)
+            states.append(state)
+            votes.append(vote)
+    # ~50 distinct states and a handful of vote labels: categorical codes make the
+    # downstream join and colour mapping work on small ints instead of strings
+    return pd.DataFrame(
+        {"geoid": pd.Categorical(states), "vote": pd.Categorical(votes)}
+    )
 
 
 class SenateSource:
     def fetch(self, congress: int, session: int, roll: int) -> pd.DataFrame:
         print("Fetching Senate Data...")
+        cached = _cache_file(congress, session, roll)
+        if cached.exists():
+            with gzip.open(cached, "rb") as f:
+                return _parse_senate_members(f)
+
         url = _senate_url(congress, session, roll)
-        r = requests.get(url, timeout=20)
-        r.raise_for_status()
-        root = ET.fromstring(r.content)
-        return _parse_senate_members(root)
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(cached.name + ".part")
+        try:
+            with SESSION.get(url, timeout=20, stream=True) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True
+                # Parse and write the cache copy from the same stream
+                with gzip.open(tmp, "wb", compresslevel=6) as out:
+                    votes = _parse_senate_members(_TeeReader(r.raw, out))
+            tmp.replace(cached)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return votes
 
 
 def present_senate_data():
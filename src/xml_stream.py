@@ -0,0 +1,25 @@
+import xml.etree.ElementTree as ET
+try:
+    from lxml import etree
+except ImportError:  # fall back to the stdlib streaming parser
+    etree = None
+
+
+def iter_elements(source, tag: str):
+    """
+    Yield every <tag> element of a file-like XML source as soon as it closes.
+
+    Each element is cleared once the caller moves on, so memory stays flat
+    instead of holding the whole parsed tree.
+    """
+    if etree is not None:
+        for _, elem in etree.iterparse(source, tag=tag, events=("end",)):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _, elem in ET.iterparse(source, events=("end",)):
+            if elem.tag == tag:
+                yield elem
+                elem.clear()
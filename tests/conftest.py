@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Keep downloaded votes/rosters out of the real ~/.cache during tests."""
+    monkeypatch.setenv("VOTEVIS_CACHE_DIR", str(tmp_path / "cache"))
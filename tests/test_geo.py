@@ -137,3 +137,19 @@ def test_join_votes_invalid_chamber_raises():
     votes = pd.DataFrame({"state": ["CA"], "vote": ["Yea"]})
     with pytest.raises(ValueError):
         join_votes("galactic-senate", votes, shapes)
+
+
+def test_read_cached_skips_disk_cache_without_pyarrow(tmp_path, monkeypatch):
+    import importlib.util
+    from src.geo import load_geo
+
+    real_find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util, "find_spec",
+        lambda name, *a: None if name == "pyarrow" else real_find_spec(name, *a),
+    )
+    shp = str(tmp_path / "toy.shp")
+    gdf = gpd.GeoDataFrame({"STUSPS": ["CA"]}, geometry=[_toy_poly()], crs="EPSG:4326")
+    out = load_geo._read_cached(shp, 0, lambda path: gdf, 0.05)
+    assert out is gdf
+    assert not list(tmp_path.glob("*.feather"))
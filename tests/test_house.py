@@ -1,5 +1,6 @@
-from src.house import HouseSource, _congress_to_year, _house_url
+from src.house import HouseSource, _congress_to_year, _house_url, _build_geoid_df, _load_member_map_from_web, MEMBER_URL
 import responses
+from responses import matchers
 import pandas as pd
 import xml.etree.ElementTree as ET
 
@@ -42,4 +43,105 @@ def test_fetch_parse_house_members():
     assert set(df.columns) == {"geoid", "vote"}
     assert len(df) == 2
     assert set(df["geoid"]) == {"CA-12", "TX-07"}
-    assert set(df["vote"]) == {"Yea", "Nay"}
\ No newline at end of file
+    assert set(df["vote"]) == {"Yea", "Nay"}
+
+def test_build_geoid_df_maps_roster_codes():
+    votes = pd.DataFrame({
+        "bioguide": ["A1", "B2", "C3", "D4"],
+        "state": ["NY", "AK", "ZZ", "CA"],
+        "vote": ["Yea", "Nay", "Yea", "Present"],
+    })
+    roster = {"A1": "NY10", "B2": "AK00", "C3": "ZZ01"}  # D4 missing from roster
+    df = _build_geoid_df(votes, roster)
+    assert df["geoid"].tolist() == ["3610", "0200"]
+    assert df["vote"].tolist() == ["Yea", "Nay"]
+
+@responses.activate
+def test_member_roster_revalidates_disk_cache():
+    roster = b"""
+    <MemberData><members>
+      <member><member-info><bioguideID>A1</bioguideID><statedistrict>NY10</statedistrict></member-info></member>
+    </members></MemberData>"""
+    responses.add(responses.GET, MEMBER_URL, body=roster, status=200, headers={"ETag": '"v1"'})
+    _load_member_map_from_web.cache_clear()
+    assert _load_member_map_from_web() == {"A1": "NY10"}
+
+    # Fresh process (empty in-memory cache): the disk copy is revalidated, not re-downloaded
+    responses.replace(responses.GET, MEMBER_URL, status=304, match=[matchers.header_matcher({"If-None-Match": '"v1"'})])
+    _load_member_map_from_web.cache_clear()
+    assert _load_member_map_from_web() == {"A1": "NY10"}
+    _load_member_map_from_web.cache_clear()
+
+@responses.activate
+def test_member_roster_refetches_truncated_disk_cache():
+    from src.house import _roster_cache_file
+    cache = _roster_cache_file()
+    cache.parent.mkdir(parents=True)
+    cache.write_text('{"etag": "\\"v1\\"", "ma')  # cut off mid-write
+    roster = b"""
+    <MemberData><members>
+      <member><member-info><bioguideID>A1</bioguideID><statedistrict>NY10</statedistrict></member-info></member>
+    </members></MemberData>"""
+    responses.add(responses.GET, MEMBER_URL, body=roster, status=200)
+    _load_member_map_from_web.cache_clear()
+    assert _load_member_map_from_web() == {"A1": "NY10"}
+    assert "If-None-Match" not in responses.calls[0].request.headers
+    _load_member_map_from_web.cache_clear()
+
+@responses.activate
+def test_get_house_roll_falls_back_to_four_digits():
+    from src.house import _get_house_roll
+    responses.add(responses.GET, "https://clerk.house.gov/evs/2023/roll045.xml", status=404)
+    responses.add(responses.GET, "https://clerk.house.gov/evs/2023/roll0045.xml", body=b"<rollcall-vote/>", status=200)
+    assert _get_house_roll(2023, 45) == b"<rollcall-vote/>"
+    assert all(c.request.method == "GET" for c in responses.calls)
+
+@responses.activate
+def test_get_house_roll_reuses_disk_cache():
+    from src.house import _get_house_roll
+    responses.add(responses.GET, "https://clerk.house.gov/evs/2023/roll045.xml", body=b"<rollcall-vote/>", status=200)
+    assert _get_house_roll(2023, 45) == b"<rollcall-vote/>"
+    # Second call is served from the gzip copy, no request made
+    assert _get_house_roll(2023, 45) == b"<rollcall-vote/>"
+    assert len(responses.calls) == 1
+
+def test_parse_house_roll_streams_records():
+    import io
+    from src.house import _parse_house_roll
+    xml = b"""
+    <rollcall-vote><vote-data>
+      <recorded-vote><legislator name-id="A1" state="NY">A</legislator><vote>Yea</vote></recorded-vote>
+      <recorded-vote><legislator name-id="B2" state="AK">B</legislator><vote>Not Voting</vote></recorded-vote>
+    </vote-data></rollcall-vote>"""
+    df = _parse_house_roll(io.BytesIO(xml))
+    assert df.to_dict("list") == {
+        "bioguide": ["A1", "B2"], "state": ["NY", "AK"], "district": ["", ""], "vote": ["Yea", "Not Voting"],
+    }
+
+@responses.activate
+def test_fetch_uses_roll_districts_without_roster(monkeypatch):
+    responses.add(responses.GET, "https://clerk.house.gov/evs/2023/roll012.xml", status=200, body=b"""
+    <rollcall-vote><vote-data>
+      <recorded-vote><legislator name-id="A1" state="CA" district="12"/><vote>Aye</vote></recorded-vote>
+      <recorded-vote><legislator name-id="B2" state="AK" district="At Large"/><vote>No</vote></recorded-vote>
+    </vote-data></rollcall-vote>""")
+    # The roster load starts alongside the download; a stale roster shows if it gets used
+    monkeypatch.setattr("src.house._load_member_map_from_web", lambda: {"A1": "NY10", "B2": "NY11"})
+    df = HouseSource().fetch(118, 12)
+    assert df["geoid"].tolist() == ["0612", "0200"]
+    assert all(c.request.url != MEMBER_URL for c in responses.calls)
+
+@responses.activate
+def test_fetch_maps_roll_through_roster_without_districts():
+    responses.add(responses.GET, "https://clerk.house.gov/evs/2023/roll012.xml", status=200, body=b"""
+    <rollcall-vote><vote-data>
+      <recorded-vote><legislator name-id="A1" state="NY"/><vote>Aye</vote></recorded-vote>
+    </vote-data></rollcall-vote>""")
+    responses.add(responses.GET, MEMBER_URL, status=200, body=b"""
+    <MemberData><members>
+      <member><member-info><bioguideID>A1</bioguideID><statedistrict>NY10</statedistrict></member-info></member>
+    </members></MemberData>""")
+    _load_member_map_from_web.cache_clear()
+    df = HouseSource().fetch(118, 12)
+    _load_member_map_from_web.cache_clear()
+    assert df["geoid"].tolist() == ["3610"]
@@ -31,3 +31,21 @@ def test_rejects_non_geodataframe():
         assert False, "Expected TypeError for non-GeoDataFrame"
     except TypeError:
         pass
+
+def test_district_hole_keeps_enclave_colour():
+    import numpy as np
+    import geopandas as gpd
+    from matplotlib.colors import to_rgb
+    from shapely.geometry import Polygon, box
+    from src.maps.plot_house import VOTE_PALETTE
+    # Enclave first, so a donut drawn without its hole would paint over it
+    enclave = box(1, 1, 3, 3)
+    donut = Polygon([(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (3, 1), (3, 3), (1, 3)]])
+    gdf = gpd.GeoDataFrame({"GEOID": ["0602", "0601"], "vote": ["Aye", "No"]}, geometry=[enclave, donut])
+    fig, ax = render_map_house(gdf, background="white")
+    fig.canvas.draw()
+    img = np.asarray(fig.canvas.buffer_rgba())
+    x, y = ax.transData.transform((2, 2))
+    pixel = img[int(img.shape[0] - y), int(x), :3] / 255
+    plt.close(fig)
+    assert np.allclose(pixel, to_rgb(VOTE_PALETTE["Aye"]), atol=0.02)
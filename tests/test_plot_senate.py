@@ -31,3 +31,18 @@ def test_rejects_non_geodataframe():
         assert False, "Expected TypeError for non-GeoDataFrame"
     except TypeError:
         pass
+
+def test_render_tile_grid_toy():
+    import geopandas as gpd
+    from shapely.geometry import box
+    gdf = gpd.GeoDataFrame(
+        {"STUSPS": ["CA", "CA", "TX", "TX"], "vote": ["Yea", "Nay", "Guilty", None], "geometry": [box(0, 0, 1, 1)] * 4},
+        geometry="geometry",
+    )
+    fig, ax = render_map_senate(gdf, background="white", title="Toy")
+    labels = [t.get_text() for t in ax.get_legend().get_texts()]
+    assert labels == ["Yea", "Nay", "Not Voting"]
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    assert buf.getbuffer().nbytes > 0
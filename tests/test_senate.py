@@ -25,4 +25,36 @@ def test_fetch_parses_members():
     responses.add(responses.GET, url, body=xml, status=200)
     df = SenateSource().fetch(117,1,45)
     assert set(df.columns) == {"geoid","vote"}
-    assert len(df) == 2
\ No newline at end of file
+    assert len(df) == 2
+
+
+@responses.activate
+def test_fetch_reuses_disk_cache():
+    url = _senate_url(117,1,46)
+    xml = b"""
+    <roll_call_vote>
+      <members>
+        <member><state>TX</state><vote_cast>Nay</vote_cast></member>
+      </members>
+    </roll_call_vote>"""
+    responses.add(responses.GET, url, body=xml, status=200)
+    first = SenateSource().fetch(117,1,46)
+    second = SenateSource().fetch(117,1,46)
+    assert len(responses.calls) == 1
+    assert first.equals(second)
+
+def test_parse_members_without_lxml(monkeypatch):
+    import io
+    import src.senate as senate_mod
+    import src.xml_stream as xml_stream
+    monkeypatch.setattr(xml_stream, "etree", None)
+    xml = b"""
+    <roll_call_vote>
+      <members>
+        <member><state>CA</state><vote_cast>Yea</vote_cast></member>
+        <member><state>CA</state><vote_cast></vote_cast></member>
+      </members>
+    </roll_call_vote>"""
+    df = senate_mod._parse_senate_members(io.BytesIO(xml))
+    assert df["geoid"].tolist() == ["CA", "CA"]
+    assert df["vote"].tolist() == ["Yea", "Not Voting"]